@@ -13,8 +13,14 @@ python -m soulstruct [source]
     [--consoleLogLevel]
     [--fileLogLevel]
 """
+from __future__ import annotations
+
 import argparse
+import importlib
 import logging
+import re
+import sys
+import typing as tp
 from pathlib import Path
 
 try:
@@ -33,41 +39,64 @@ else:
     RESET = Fore.RESET
 
 from soulstruct._logging import CONSOLE_HANDLER, FILE_HANDLER
-from soulstruct.config import DEFAULT_PROJECT_PATH
-from soulstruct.games import Game, get_game
-from soulstruct.utilities.files import read_json
 from soulstruct.utilities.text import word_wrap
 
-from soulstruct_gui.misc.game_selector import GameSelector
+if tp.TYPE_CHECKING:
+    from soulstruct.games import Game
+
+# NOTE: Other Soulstruct modules (config, games, GUI windows) are imported only once arguments have been parsed, so that
+# `--help` and argument errors don't pay for them.
 
 
 LOG_LEVELS = {"debug", "info", "warning", "error", "fatal", "critical"}
 _LOGGER = logging.getLogger("soulstruct_gui")
 
 
+# Maps `Game.variable_name` to the GUI submodule for that game.
+_GAME_GUI_SUBMODULES = {
+    "DARK_SOULS_PTDE": "soulstruct_gui.darksouls1ptde",
+    "DARK_SOULS_DSR": "soulstruct_gui.darksouls1r",
+    "BLOODBORNE": "soulstruct_gui.bloodborne",
+    "ELDENRING": "soulstruct_gui.eldenring",
+}
+
+# Maps `--game` argument values (and aliases) to `get_game()` names.
+_GAME_ARG_NAMES = {
+    "ptde": "darksouls1ptde",
+    "darksouls1ptde": "darksouls1ptde",
+    "ds1ptde": "darksouls1ptde",
+    "dsr": "darksouls1r",
+    "darksouls1r": "darksouls1r",
+    "ds1r": "darksouls1r",
+    "bb": "bloodborne",
+    "bloodborne": "bloodborne",
+    # "ds3": "darksouls3",
+    # "darksouls3": "darksouls3",
+    # "dsiii": "darksouls3",
+    # "darksoulsiii": "darksouls3",
+    "er": "eldenring",
+    "eldenring": "eldenring",
+}
+
+# Plain (unescaped) "GameName" string value in a project's `project_config.json`.
+_PROJECT_GAME_NAME_RE = re.compile(rb'"GameName"\s*:\s*"([^"\\]*)"')
+
+
 def _import_game_gui_submodule(game: Game):
-    match game.variable_name:
-        case "DARK_SOULS_PTDE":
-            from soulstruct_gui import darksouls1ptde
-            return darksouls1ptde
-        case "DARK_SOULS_DSR":
-            from soulstruct_gui import darksouls1r
-            return darksouls1r
-        case "BLOODBORNE":
-            from soulstruct_gui import bloodborne
-            return bloodborne
-        case "ELDENRING":
-            from soulstruct_gui import eldenring
-            return eldenring
-        case _:
-            raise ValueError(f"Game has no GUI support: {game.variable_name}")
+    try:
+        module_name = _GAME_GUI_SUBMODULES[game.variable_name]
+    except KeyError:
+        raise ValueError(f"Game has no GUI support: {game.variable_name}")
+    if (module := sys.modules.get(module_name)) is not None:
+        return module  # already imported (e.g. console re-entry)
+    return importlib.import_module(module_name)
 
 
 parser = argparse.ArgumentParser(prog="soulstruct_gui", description="Launch Soulstruct programs or adjust settings.")
 parser.add_argument(
     "source",
     nargs="?",
-    default=DEFAULT_PROJECT_PATH,
+    default=None,  # `DEFAULT_PROJECT_PATH` from `config.py`, resolved (and imported) after parsing
     help=word_wrap(
         "Source file or project directory to read from. Defaults to `DEFAULT_PROJECT_PATH` from `config.py`, which "
         "will be auto-generated the first time you run Soulstruct. If your project path is relative, it will be "
@@ -141,11 +170,21 @@ Lighting = None
 
 
 def get_existing_project_game(project_path: str):
-    project_path = Path(project_path)
-    if project_path.is_dir() and (project_path / "project_config.json").is_file():
-        project_config = read_json(project_path / "project_config.json")
-        if game_name := project_config.get("GameName", ""):
-            return get_game(game_name)
+    from soulstruct.games import get_game
+    from soulstruct.utilities.files import read_json
+
+    project_config_path = Path(project_path) / "project_config.json"
+    try:
+        project_config_bytes = project_config_path.read_bytes()
+    except OSError:  # no project config (or `project_path` is not a directory)
+        return None
+    # Only "GameName" is needed, so skip parsing the whole config unless it is unusually formatted (e.g. escapes).
+    if game_name_match := _PROJECT_GAME_NAME_RE.search(project_config_bytes):
+        game_name = game_name_match.group(1).decode()
+    else:
+        game_name = read_json(project_config_path).get("GameName", "")
+    if game_name:
+        return get_game(game_name)
     return None
 
 
@@ -167,13 +206,20 @@ def soulstruct_gui_main(ss_args) -> bool:
         file_log_level = getattr(logging, ss_args.fileLogLevel.upper())
     FILE_HANDLER.setLevel(file_log_level)
 
-    source = None if not ss_args.source else ss_args.source
+    source = ss_args.source
+    if source is None:
+        from soulstruct.config import DEFAULT_PROJECT_PATH
+        source = DEFAULT_PROJECT_PATH
+    source = None if not source else source
 
     if ss_args.modmanager:
         from soulstruct_gui.misc.mod_manager import ModManagerWindow
         ModManagerWindow(source).wait_window()
         return ss_args.console
 
+    from soulstruct.games import get_game
+    from soulstruct_gui.misc.game_selector import GameSelector
+
     if ss_args.maps:
         game = GameSelector("darksouls1ptde", "darksouls1r", "bloodborne").go()
         global Maps
@@ -202,19 +248,10 @@ def soulstruct_gui_main(ss_args) -> bool:
     game = get_existing_project_game(source) if source else None
     if game is None:
         if ss_args.game:
-            match ss_args.game:
-                case "ptde" | "darksouls1ptde" | "ds1ptde":
-                    game = get_game("darksouls1ptde")
-                case "dsr" | "darksouls1r" | "ds1r":
-                    game = get_game("darksouls1r")
-                case "bb" | "bloodborne":
-                    game = get_game("bloodborne")
-                # case "ds3" | "darksouls3" | "dsiii" | "darksoulsiii":
-                #     game = get_game("darksouls3")
-                case "er" | "eldenring":
-                    game = get_game("eldenring")
-                case _:
-                    raise ValueError(f"Invalid game name: {ss_args.game}")
+            try:
+                game = get_game(_GAME_ARG_NAMES[ss_args.game])
+            except KeyError:
+                raise ValueError(f"Invalid game name: {ss_args.game}")
         else:
             game = GameSelector("darksouls1ptde", "darksouls1r", "bloodborne", "eldenring").go()
 
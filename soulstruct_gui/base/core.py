@@ -13,6 +13,7 @@ import subprocess
 import sys
 import threading
 import typing as tp
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from soulstruct import __version__
@@ -120,6 +121,7 @@ class GameDirectoryProject(abc.ABC):
         self.other_settings = {}
 
         self._data = {}
+        self._game_event_directory_future = None  # type: Future[EventDirectory] | None
 
         self.project_root = self._validate_project_directory(Path(project_path), self._DEFAULT_PROJECT_ROOT)
 
@@ -281,7 +283,11 @@ class GameDirectoryProject(abc.ABC):
         event_class = self.get_data_class(ProjectDataType.Events)  # type: type[EventDirectory]
         import_directory = Path(import_directory)
         event_directory_path = self.get_data_game_path(ProjectDataType.Events, root=import_directory)
-        event_directory = event_class.from_path(event_directory_path)
+        future, self._game_event_directory_future = self._game_event_directory_future, None
+        if future is not None and import_directory == self.game_root:
+            event_directory = future.result()  # parsed while Creator Wizard was open
+        else:
+            event_directory = event_class.from_path(event_directory_path)
         # TODO: Enums must be written first to make use of them (obviously).
         #  Can just pass our GameEnumsManager itself, in that case.
         if use_enums_in_event_scripts:
@@ -930,18 +936,35 @@ class GameDirectoryProject(abc.ABC):
         if not import_settings:
             return False  # abort peacefully
 
-        for data_type in self.DATA_TYPES:
-            if data_type not in import_settings.import_data_types:
-                # Data not imported. Tab will not appear. Can be imported later from GUI menu.
-                setattr(self, data_type.value, None)
-                continue
-            # NOTE: It's up to each `import` function signature to match settings names properly.
-            import_func = getattr(self, f"import_{data_type.name}")
-            import_func(import_directory=self.game_root, **import_settings.data_type_settings[data_type])
-            # NOTE: Enums, Events, and Talk data are 'saved' implicitly on import (plaintext scripts written).
-            if data_type not in {ProjectDataType.Enums, ProjectDataType.Events, ProjectDataType.Talk}:
-                save_func = getattr(self, f"save_{data_type.name}")
-                save_func()
+        executor = None
+        if ProjectDataType.Events in import_settings.import_data_types:
+            # EMEVD parsing does not depend on any import settings, so start it while earlier data types are imported.
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._game_event_directory_future = executor.submit(
+                self.get_data_class(ProjectDataType.Events).from_path,
+                self.get_data_game_path(ProjectDataType.Events),
+            )
+
+        try:
+            for data_type in self.DATA_TYPES:
+                if data_type not in import_settings.import_data_types:
+                    # Data not imported. Tab will not appear. Can be imported later from GUI menu.
+                    setattr(self, data_type.value, None)
+                    continue
+                # NOTE: It's up to each `import` function signature to match settings names properly.
+                import_func = getattr(self, f"import_{data_type.name}")
+                import_func(import_directory=self.game_root, **import_settings.data_type_settings[data_type])
+                # NOTE: Enums, Events, and Talk data are 'saved' implicitly on import (plaintext scripts written).
+                if data_type not in {ProjectDataType.Enums, ProjectDataType.Events, ProjectDataType.Talk}:
+                    save_func = getattr(self, f"save_{data_type.name}")
+                    save_func()
+        finally:
+            # Discard the parse if `import_Events()` did not consume it (i.e. an earlier import failed).
+            future, self._game_event_directory_future = self._game_event_directory_future, None
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         self.python_script_directory = self.project_root / "python_scripts"
 
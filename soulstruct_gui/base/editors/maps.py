@@ -195,10 +195,9 @@ class MapFieldRow(FieldRow):
             self.value_vector_frame, text="", bg=bg_color, width=third_width, column=2, anchor="w"
         )
         for coord, label in zip("xyz", (self.value_vector_x, self.value_vector_y, self.value_vector_z)):
-            vector_bindings = main_bindings.copy()
-            vector_bindings.update(
-                {"<Button-1>": lambda _, c=coord: editor.select_displayed_field_row(row_index, coord=c)}
-            )
+            vector_bindings = main_bindings | {
+                "<Button-1>": lambda _, c=coord: editor.select_displayed_field_row(row_index, coord=c)
+            }
             bind_events(label, vector_bindings)
 
         self.value_shape_frame = editor.Frame(
@@ -248,14 +247,11 @@ class MapFieldRow(FieldRow):
         )
 
         for dim, label in zip("RWHD", (self.value_shape_R, self.value_shape_W, self.value_shape_H, self.value_shape_D)):
-            shape_bindings = main_bindings.copy()
-            shape_bindings.update(
-                {
-                    "<Button-1>": lambda _, d=dim: editor.select_displayed_field_row(
-                        row_index, edit_if_already_selected=d in self.master.valid_shape_dims, shape_dim=d
-                    )
-                }
-            )
+            shape_bindings = main_bindings | {
+                "<Button-1>": lambda _, d=dim: editor.select_displayed_field_row(
+                    row_index, edit_if_already_selected=d in self.master.valid_shape_dims, shape_dim=d
+                )
+            }
             bind_events(label, shape_bindings)
 
         self.unhide()
@@ -863,6 +859,8 @@ class MapsEditor(BaseFieldEditor, abc.ABC, tp.Generic[MSB_TYPE]):
     e_coord: str | None
     e_shape_dim: str | None  # "R", "H", "W", etc. (specific to `RegionShape` subtypes)
     valid_shape_dims: str  # `e_shape_dim` values that are currently valid (for edit decision)
+    # `(maps, map_choice_stem, category, subtype_list)` from last `_get_category_subtype_list()` call.
+    _subtype_list_cache: tuple[MapStudioDirectory, str, str, MSBEntryList] | None
 
     def __init__(
         self,
@@ -880,6 +878,7 @@ class MapsEditor(BaseFieldEditor, abc.ABC, tp.Generic[MSB_TYPE]):
         self.valid_shape_dims = ""
         self.map_choice = None
         self.entry_canvas_context_menu = None
+        self._subtype_list_cache = None
         super().__init__(project, linker, master=master, toplevel=toplevel, window_title="Soulstruct Map Data Editor")
 
     @property
@@ -983,16 +982,32 @@ class MapsEditor(BaseFieldEditor, abc.ABC, tp.Generic[MSB_TYPE]):
         return ENTRY_LIST_FG_COLORS.get(category.split(":")[0], "#FFF")
 
     def _get_category_subtype_list(self, category: str = None) -> MSBEntryList:
-        """Get the selected category's subtype name and return its `MSB` entry list."""
+        """Get the selected category's subtype name and return its `MSB` entry list.
+
+        The last result is memoized for the current `maps` object, map choice, and category. Entry lists are mutated
+        in place, so the cached list stays valid until the project's maps are reloaded or the selection changes.
+        """
         if category is None:
             category = self.active_category
             if category is None:
                 raise ValueError("Cannot get MSB subtype entry list without `category` if `active_category` is None.")
+        maps = self.maps
+        map_choice_stem = self.map_choice_stem
+        cache = self._subtype_list_cache
+        if cache is not None and cache[0] is maps and cache[1] == map_choice_stem and cache[2] == category:
+            return cache[3]
         try:
             supertype_name, subtype_name = category.split(": ")
         except ValueError:
             raise ValueError(f"MSB category name was not in '[supertype]: [subtype]' format: {category}")
-        return self.get_selected_msb()[subtype_name]
+        subtype_list = self.get_selected_msb()[subtype_name]
+        self._subtype_list_cache = (maps, map_choice_stem, category, subtype_list)
+        return subtype_list
+
+    @staticmethod
+    def _entry_name_exists(subtype_list: MSBEntryList, name: str) -> bool:
+        """Check if any entry in `subtype_list` has `name`, without materializing a list of all entry names."""
+        return any(entry.name == name for entry in subtype_list)
 
     def _add_entry(self, subtype_index: int, text: str, category=None, new_field_dict: MSBEntry = None):
         """Active category is required."""
@@ -1031,7 +1046,7 @@ class MapsEditor(BaseFieldEditor, abc.ABC, tp.Generic[MSB_TYPE]):
                 new_n = int(match.group(2)) + 1
                 digits = len(match.group(2))
                 new_name = f"{match.group(1)}{new_n:>0{digits}}{match.group(3)}"
-                if new_name not in subtype_list.get_entry_names():
+                if not self._entry_name_exists(subtype_list, new_name):
                     msb_entry.name = new_name
                     try:
                         sib_path = getattr(msb_entry, "sib_path")
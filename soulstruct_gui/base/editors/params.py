@@ -429,8 +429,7 @@ class ParamFinder(SmartFrame):
 
         if initial_conditions:
             self.conditions = initial_conditions
-            for condition in initial_conditions:
-                self._condition_listbox.insert("end", str(condition))
+            self._condition_listbox.insert("end", *(str(condition) for condition in initial_conditions))
 
         self.bind_all("<Escape>", lambda e: self.done(False))
         self.protocol("WM_DELETE_WINDOW", lambda: self.done(False))
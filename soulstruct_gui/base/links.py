@@ -13,8 +13,11 @@ __all__ = [
 ]
 
 import abc
+import functools
 import typing as tp
+from pathlib import Path
 
+from soulstruct.containers import Binder
 from soulstruct.exceptions import SoulstructError
 from soulstruct.base.game_types import *
 
@@ -30,12 +33,43 @@ class LinkError(SoulstructError):
     pass
 
 
+@functools.lru_cache(maxsize=32)
+def _get_binder_entry_names(binder_path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    """Entry names of the Binder at `binder_path`, parsed once per file modification time (`mtime_ns`) and `size`.
+
+    Size is also checked because coarse filesystem timestamps (e.g. FAT) may not change if a file is quickly rewritten.
+    """
+    return frozenset(Binder.from_path(binder_path).get_entry_names())
+
+
+@functools.lru_cache(maxsize=4)  # whole files are kept, so only the few most recently checked
+def _get_file_bytes(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Raw bytes of (small, e.g. binder header) file at `file_path`, read once per file modification time and size."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
 class WindowLinker:
     """Interface that generates links (go-to commands) between arbitrary parts of the Soulstruct unified window."""
 
     def __init__(self, window: ProjectWindow):
         self.window = window
         self.project = window.project
+        # Param tables looked up by nickname, valid only for the `project.params` object they were looked up in.
+        self._param_cache = {}
+        self._param_cache_source = None
+
+    def _get_param(self, param_nickname: str):
+        """Get `project.params.get_param(param_nickname)`, cached until the project's `params` object is replaced."""
+        params = self.project.params
+        if params is not self._param_cache_source:
+            self._param_cache = {}
+            self._param_cache_source = params
+        try:
+            return self._param_cache[param_nickname]
+        except KeyError:
+            param = self._param_cache[param_nickname] = params.get_param(param_nickname)
+            return param
 
     def get_tab_index(self, tab_name):
         return self.window.ordered_tabs.index(tab_name.lower())
@@ -247,6 +281,22 @@ class WindowLinker:
         """Check appropriate game model files to confirm the given model name is valid."""
         ...
 
+    @staticmethod
+    def _binder_entry_names(binder_path: Path) -> frozenset[str]:
+        """Get entry names of Binder file `binder_path`, which is only re-read after it is modified on disk."""
+        stat = binder_path.stat()
+        return _get_binder_entry_names(str(binder_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _file_contains(path: Path, name: str) -> bool:
+        """Brute-force check for ASCII `name` anywhere in the raw bytes of file `path` (e.g. a binder header).
+
+        File bytes are only re-read after the file is modified on disk, so checking many names in the same header
+        (e.g. every collision in a map) reads it once.
+        """
+        stat = path.stat()
+        return name.encode() in _get_file_bytes(str(path), stat.st_mtime_ns, stat.st_size)
+
     # region Link Execution
     def execute_text_link(self, text_type_name, text_id):
         self.window.page_tabs.select(self.get_tab_index("text"))
@@ -332,7 +332,7 @@ class NameSelectionBox(SmartFrame):
         self.split_string = split_string
 
         with self.set_master(padx=20, pady=20, auto_rows=0):
-            self.Label(text="Double-click an entry to select it.")
+            self.Label(text="Double-click an entry to select it.", mutable=False)
             self._names = self.Listbox(
                 values=names,
                 width=self.WIDTH,
@@ -388,7 +388,7 @@ class CategorizedNameSelectionBox(SmartFrame):
             raise ValueError(f"Initial category '{initial_category}' not in categories.")
 
         with self.set_master(padx=40, pady=40, auto_rows=0):
-            self.Label(text="Double-click an entry to select it.", pady=(0, 20))
+            self.Label(text="Double-click an entry to select it.", pady=(0, 20), mutable=False)
             self._category = self.Combobox(
                 values=list(categories.keys()),
                 initial_value=initial_category,
@@ -428,15 +428,17 @@ class CategorizedNameSelectionBox(SmartFrame):
     def _update_category(self, _):
         """Called on dropdown change. Updates the list of names to match the selected category."""
         self._names.delete(0, "end")
-        for name in self.categories[self._category.var.get()]:
-            self._names.insert("end", name)
+        names = self.categories[self._category.var.get()]
+        if names:
+            self._names.insert("end", *names)
 
     def _filter_names(self, filter_text: str):
         """Called on text change. Filters the list of names to match the entered text."""
         self._names.delete(0, "end")
-        for name in self.categories[self._category.var.get()]:
-            if filter_text.lower() in name.lower():
-                self._names.insert("end", name)
+        filter_text = filter_text.lower()
+        names = [name for name in self.categories[self._category.var.get()] if filter_text in name.lower()]
+        if names:
+            self._names.insert("end", *names)
 
     def go(self):
         self.wait_visibility()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-__all__ = ["ImportSettings", "ProjectCreatorWizard", "ProjectWindow"]
+__all__ = ["ImportSettings", "LazyImport", "ProjectCreatorWizard", "ProjectWindow"]
 
 import abc
+import importlib
 import logging
 import re
 import subprocess
@@ -57,6 +58,27 @@ TAB_EDITORS = {
 }  # also specifies tab order ("runtime" always comes last, followed by any other game-specific extras)
 
 
+class LazyImport:
+    """Class attribute that imports `module_name.attr_name` on first access and then replaces itself with it.
+
+    Lets game `ProjectWindow` subclasses name heavy, rarely needed classes or tables (e.g. `CHARACTER_MODELS`) without
+    importing them until they are actually used.
+    """
+
+    def __init__(self, module_name: str, attr_name: str):
+        self.module_name = module_name
+        self.attr_name = attr_name
+        self.name = attr_name
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = getattr(importlib.import_module(self.module_name), self.attr_name)
+        setattr(owner, self.name, value)  # later lookups skip this descriptor
+        return value
+
+
 class ImportSettings(tp.NamedTuple):
     """Constructed from `ProjectCreatorWizard.done()`."""
     import_data_types: list[ProjectDataType]
@@ -94,7 +116,7 @@ class ProjectCreatorWizard(SmartFrame):
         #     - Remove glitched, unused Duke's Archives regions?
 
         with self.set_master(column_weights=[1], row_weights=[0, 1, 0], auto_rows=0, sticky="nsew", padx=20, pady=20):
-            self.Label(text=game_name, font=24)
+            self.Label(text=game_name, font=24, mutable=False)
             self.build_data_type_settings(supported_data_types, data_type_settings, extra_settings)
             self.Button(
                 text="Create Project",
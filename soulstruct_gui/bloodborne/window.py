@@ -18,6 +18,9 @@ class ProjectWindow(_BaseProjectWindow):
     RUNTIME_MANAGER_CLASS = None
     CHARACTER_MODELS = {}  # TODO
 
+    # Params whose entries can be renamed from text, in menu order (handful of "spells" not renamed).
+    _TEXT_RENAMABLE_PARAMS = ("Weapons", "Armor", "Goods", "GemsAndRunes")
+
     project: GameDirectoryProject
 
     def _build_tools_menu(self, tools_menu):
@@ -35,7 +38,7 @@ class ProjectWindow(_BaseProjectWindow):
             foreground="#FFF",
             command=self._rename_param_entries_from_text,
         )
-        for param_nickname in ("Weapons", "Armor", "Goods", "GemsAndRunes"):  # handful of "spells" not renamed
+        for param_nickname in self._TEXT_RENAMABLE_PARAMS:
             params_menu.add_command(
                 label=f"Rename {param_nickname} from Text",
                 foreground="#FFF",
@@ -49,7 +52,7 @@ class ProjectWindow(_BaseProjectWindow):
         if self.current_data_type == ProjectDataType.Params:
             if (
                 not param_nickname
-                and self.params_tab.active_category in {"Weapons", "Armor", "Goods", "GemsAndRunes"}
+                and self.params_tab.active_category in self._TEXT_RENAMABLE_PARAMS
                 or param_nickname == self.params_tab.active_category
             ):
                 self.params_tab.refresh_entries()
@@ -4,7 +4,6 @@ __all__ = ["WindowLinker"]
 
 import typing as tp
 
-from soulstruct.containers import Binder
 from soulstruct.darksouls1ptde.game_types.map_types import *
 from soulstruct.darksouls1ptde.game_types.param_types import *
 
@@ -36,8 +35,8 @@ class WindowLinker(_BaseWindowLinker):
             if not param_nickname:
                 # Could be Player or Non Player. Provide both links.
                 param_nickname = "Attacks" if field_type == AttackParam else "Behaviors"
-                player_param = self.project.params.get_param(f"Player{param_nickname}")
-                non_player_param = self.project.params.get_param(f"NonPlayer{param_nickname}")
+                player_param = self._get_param(f"Player{param_nickname}")
+                non_player_param = self._get_param(f"NonPlayer{param_nickname}")
                 links = []
                 if field_value in player_param:
                     links.append(
@@ -75,13 +74,11 @@ class WindowLinker(_BaseWindowLinker):
         else:
             param_nickname = field_type.get_param_nickname()
 
-        param = self.project.params.get_param(param_nickname)
-        try:
-            name = param[field_value].Name + name_extension
-        except KeyError:
-            return [BrokenLink()]
-        else:
-            return [ParamsLink(self, param_name=param_nickname, param_entry_id=field_value, name=name)]
+        param = self._get_param(param_nickname)
+        if field_value not in param:
+            return [BrokenLink()]  # checked up front, as broken links are common and raising is slower
+        name = param[field_value].Name + name_extension
+        return [ParamsLink(self, param_name=param_nickname, param_entry_id=field_value, name=name)]
 
     def check_other_link_types(self, field_type, field_value, valid_null_values: dict, map_override) -> list[BaseLink]:
 
@@ -129,14 +126,12 @@ class WindowLinker(_BaseWindowLinker):
             hkxbhd_path = self.project.game_root / f"map/{map_stem}/h{map_stem}.hkxbhd"
             if hkxbhd_path.is_file():
                 # NOTE: Brute-force check for name string in header file (for speed).
-                with hkxbhd_path.open("r") as f:
-                    if f"{model_name}{map_stem[1:3]}.hkx.dcx" in f.read():
-                        return True
+                if self._file_contains(hkxbhd_path, f"{model_name}{map_stem[1:3]}.hkx.dcx"):
+                    return True
         elif model_game_type == NavmeshModel:
             nvmbnd_path = self.project.game_root / f"map/{map_stem}/{map_stem}.nvmbnd"
             if nvmbnd_path.is_file():
-                navmesh_bnd = Binder.from_path(nvmbnd_path)
-                if f"{model_name}{map_stem[1:3]}.nvm" in navmesh_bnd.get_entry_names():
+                if f"{model_name}{map_stem[1:3]}.nvm" in self._binder_entry_names(nvmbnd_path):
                     return True
 
         return False
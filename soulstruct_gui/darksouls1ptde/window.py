@@ -18,6 +18,9 @@ class ProjectWindow(_BaseProjectWindow):
     RUNTIME_MANAGER_CLASS = RuntimeManager
     CHARACTER_MODELS = CHARACTER_MODELS
 
+    # Params whose entries can be renamed from text, in menu order.
+    _TEXT_RENAMABLE_PARAMS = ("Weapons", "Armor", "Rings", "Goods", "Spells")
+
     def _build_tools_menu(self, tools_menu):
         params_submenu = self.Menu(tearoff=0)
         self._build_params_submenu(params_submenu)
@@ -33,7 +36,7 @@ class ProjectWindow(_BaseProjectWindow):
             foreground="#FFF",
             command=self._rename_param_entries_from_text,
         )
-        for param_nickname in ("Weapons", "Armor", "Rings", "Goods", "Spells"):
+        for param_nickname in self._TEXT_RENAMABLE_PARAMS:
             params_menu.add_command(
                 label=f"Rename {param_nickname} from Text",
                 foreground="#FFF",
@@ -46,7 +49,7 @@ class ProjectWindow(_BaseProjectWindow):
         if self.current_data_type == self.PROJECT_CLASS.DataType.Params:
             if (
                 not param_nickname
-                and self.params_tab.active_category in {"Weapons", "Armor", "Rings", "Goods", "Spells"}
+                and self.params_tab.active_category in self._TEXT_RENAMABLE_PARAMS
                 or param_nickname == self.params_tab.active_category
             ):
                 self.params_tab.refresh_entries()
@@ -4,7 +4,6 @@ __all__ = ["WindowLinker"]
 
 import typing as tp
 
-from soulstruct.containers import Binder
 from soulstruct.darksouls1r.game_types.map_types import *
 
 from soulstruct_gui.darksouls1ptde.links import WindowLinker as _BaseWindowLinker
@@ -48,14 +47,12 @@ class WindowLinker(_BaseWindowLinker):
             hkxbhd_path = self.project.game_root / f"map/{map_stem}/h{map_stem}.hkxbhd"
             if hkxbhd_path.is_file():
                 # NOTE: Brute-force check for name string in header file (for speed).
-                with hkxbhd_path.open("r") as f:
-                    if f"{model_name}{map_stem[1:3]}.hkx.dcx" in f.read():
-                        return True
+                if self._file_contains(hkxbhd_path, f"{model_name}{map_stem[1:3]}.hkx.dcx"):
+                    return True
         elif model_game_type == NavmeshModel:
             nvmbnd_path = self.project.game_root / f"map/{map_stem}/{map_stem}.nvmbnd.dcx"
             if nvmbnd_path.is_file():
-                navmesh_bnd = Binder.from_path(nvmbnd_path)
-                if f"{model_name}{map_stem[1:3]}.nvm" in navmesh_bnd.get_entry_names():
+                if f"{model_name}{map_stem[1:3]}.nvm" in self._binder_entry_names(nvmbnd_path):
                     return True
 
         return False
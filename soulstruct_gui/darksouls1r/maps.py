@@ -48,8 +48,7 @@ class MapsEditor(BaseMapsEditor):
         connect_collision = ConnectCollisionCreator(collision, self.maps.ALL_MAPS, master=self).go()
         if connect_collision:
             msb = self.get_selected_msb()
-            existing_connect_collision_names = msb.connect_collisions.get_entry_names()
-            if connect_collision.name in existing_connect_collision_names:
+            if self._entry_name_exists(msb.connect_collisions, connect_collision.name):
                 self.error_dialog(
                     "Map Connection Name Conflict",
                     f"A Map Connection with the name '{connect_collision.name}' already exists in this MSB. Try deleting "
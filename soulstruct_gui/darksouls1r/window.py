@@ -4,6 +4,8 @@ __all__ = ["ProjectWindow"]
 
 import logging
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from soulstruct.darksouls1r.maps import MSB
 from soulstruct.darksouls1r.maps.parts import MSBPlayerStart
@@ -21,6 +23,9 @@ from .runtime import RuntimeManager
 
 _LOGGER = logging.getLogger("soulstruct_gui")
 
+# Each FFXBND rebuild may hold several vanilla FFXBNDs in memory, so only a few run at once.
+_MAX_FFXBND_WORKERS = min(4, os.cpu_count() or 4)
+
 
 class ProjectWindow(_BaseProjectWindow):
     PROJECT_CLASS = GameDirectoryProject
@@ -30,6 +35,9 @@ class ProjectWindow(_BaseProjectWindow):
     RUNTIME_MANAGER_CLASS = RuntimeManager
     CHARACTER_MODELS = CHARACTER_MODELS
 
+    # Params whose entries can be renamed from text, in menu order.
+    _TEXT_RENAMABLE_PARAMS = ("Weapons", "Armor", "Rings", "Goods", "Spells")
+
     project: GameDirectoryProject
     runtime_tab: RuntimeManager
 
@@ -63,7 +71,7 @@ class ProjectWindow(_BaseProjectWindow):
             foreground="#FFF",
             command=self._rename_param_entries_from_text,
         )
-        for param_nickname in ("Weapons", "Armor", "Rings", "Goods", "Spells"):
+        for param_nickname in self._TEXT_RENAMABLE_PARAMS:
             params_menu.add_command(
                 label=f"Rename {param_nickname} from Text",
                 foreground="#FFF",
@@ -107,7 +115,7 @@ class ProjectWindow(_BaseProjectWindow):
         if self.current_data_type == self.PROJECT_CLASS.DataType.Params:
             if (
                 not param_nickname
-                and self.params_tab.active_category in {"Weapons", "Armor", "Rings", "Goods", "Spells"}
+                and self.params_tab.active_category in self._TEXT_RENAMABLE_PARAMS
                 or param_nickname == self.params_tab.active_category
             ):
                 self.params_tab.refresh_entries()
@@ -123,16 +131,32 @@ class ProjectWindow(_BaseProjectWindow):
             )
 
         def _threaded_rebuild_ffxbnd():
+            sfx_directory = self.project.game_root / "sfx"
+            vanilla_sfx_directory = vanilla_game_root / "sfx"
+
+            # Group MSBs by output FFXBND so that no file is written (or backed up) by two workers at once.
+            msbs_by_ffxbnd_name = {}
             for map_stem, msb in self.project.maps.files.items():
                 game_map = self.project.maps.GET_MAP(map_stem)
                 if not game_map.ffxbnd_file_name:
                     _LOGGER.warning(f"No FFXBND file name known for map: {map_stem}. Nothing written.")
-                build_ffxbnd(
-                    msb,
-                    ffxbnd_path=self.project.game_root / f"sfx/{game_map.ffxbnd_file_name}.ffxbnd.dcx",
-                    ffxbnd_search_directory=vanilla_game_root / "sfx",
-                    prefer_bak=True,
-                )
+                    continue
+                msbs_by_ffxbnd_name.setdefault(game_map.ffxbnd_file_name, []).append(msb)
+
+            def _rebuild_ffxbnd(ffxbnd_file_name: str, msbs: list[MSB]):
+                for msb in msbs:
+                    build_ffxbnd(
+                        msb,
+                        ffxbnd_path=sfx_directory / f"{ffxbnd_file_name}.ffxbnd.dcx",
+                        ffxbnd_search_directory=vanilla_sfx_directory,
+                        prefer_bak=True,
+                    )
+
+            # Most of each rebuild is DCX (zlib) work and file I/O, which release the GIL, so separate FFXBNDs overlap.
+            with ThreadPoolExecutor(max_workers=_MAX_FFXBND_WORKERS) as executor:
+                list(
+                    executor.map(_rebuild_ffxbnd, msbs_by_ffxbnd_name.keys(), msbs_by_ffxbnd_name.values())
+                )  # re-raises any error
 
         try:
             self._thread_with_loading_dialog(
@@ -157,8 +181,9 @@ class ProjectWindow(_BaseProjectWindow):
 
     def _write_all_nvmdumps(self):
         """Write NVMDUMP files for all maps."""
+        map_directory = self.project.game_root / "map"
         for map_stem, msb in self.project.maps.files.items():
-            nvmdump_path = self.project.game_root / f"map/{map_stem}/{map_stem}.nvmdump"
+            nvmdump_path = map_directory / map_stem / f"{map_stem}.nvmdump"
             nvmdump = msb.get_nvmdump(map_stem)
             nvmdump_path.write_text(nvmdump)
 
@@ -183,8 +208,9 @@ class ProjectWindow(_BaseProjectWindow):
         map_id = self.linker.get_current_map_id()
         if map_id is None:
             return self.CustomDialog("Game Not Loaded", "Could not detect player in any game map.")
-        player_start_id = map_id[0] * 100000 + map_id[1] * 10000 + self.RELOAD_WARP_PLAYER_START_SUFFIX
-        request_warp_flag_id = 10000000 + map_id[0] * 100000 + map_id[1] * 10000 + self.RELOAD_WARP_FLAG_SUFFIX
+        map_id_base = map_id[0] * 100000 + map_id[1] * 10000
+        player_start_id = map_id_base + self.RELOAD_WARP_PLAYER_START_SUFFIX
+        request_warp_flag_id = 10000000 + map_id_base + self.RELOAD_WARP_FLAG_SUFFIX
         current_map = self.project.maps.GET_MAP(map_id)
         current_msb_path = self.project.get_data_game_path(ProjectDataType.Maps) / f"{current_map.msb_file_stem}.msb"
         current_msb = MSB.from_path(current_msb_path)
@@ -4,12 +4,11 @@ __all__ = ["ProjectWindow"]
 
 import typing as tp
 
-from soulstruct.eldenring.constants import CHARACTER_MODELS
-
 from soulstruct_gui.base.enums import ProjectDataType
-from soulstruct_gui.base.window import ProjectWindow as _BaseProjectWindow, ImportSettings, ProjectCreatorWizard
+from soulstruct_gui.base.window import (
+    ProjectWindow as _BaseProjectWindow, ImportSettings, LazyImport, ProjectCreatorWizard
+)
 from .core import GameDirectoryProject
-from .maps import MapsEditor
 from .links import WindowLinker
 
 
@@ -17,8 +16,8 @@ class ProjectWindow(_BaseProjectWindow):
     PROJECT_CLASS = GameDirectoryProject
     LINKER_CLASS = WindowLinker
     RUNTIME_MANAGER_CLASS = None
-    CHARACTER_MODELS = CHARACTER_MODELS
-    MAPS_EDITOR_CLASS = MapsEditor
+    CHARACTER_MODELS = LazyImport("soulstruct.eldenring.constants", "CHARACTER_MODELS")  # only needed by Maps tab
+    MAPS_EDITOR_CLASS = LazyImport("soulstruct_gui.eldenring.maps", "MapsEditor")  # imports all ER game types
 
     project: GameDirectoryProject
 
@@ -23,7 +23,7 @@ class GameSelector(SmartFrame):
 
     def build(self, name_options):
         with self.set_master(padx=20, pady=10, auto_rows=0):
-            self.Label(text="Choose the game you are modding:", padx=10, pady=20)
+            self.Label(text="Choose the game you are modding:", padx=10, pady=20, mutable=False)
             for name_option in name_options:
                 try:
                     game = get_game(name_option)
@@ -65,8 +65,8 @@ class ModManagerWindow(SmartFrame):
                     )
                     self.Button(text="Delete Bak Files", width=40, command=self._delete_bak_files, bg="#226")
 
-        for mod_info in self.mods:
-            self.mod_list.insert("end", mod_info["nickname"])
+        if self.mods:
+            self.mod_list.insert("end", *(mod_info["nickname"] for mod_info in self.mods))
 
         self.set_geometry()
 
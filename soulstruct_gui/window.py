@@ -7,24 +7,68 @@ __all__ = [
     "ToolTip",
     "bind_to_all_children",
     "embed_component",
+    "enable_dpi_awareness",
 ]
 
-import contextlib
 import logging
+import re
 import tkinter as tk
 import typing as tp
-from ctypes import windll
-from functools import wraps
+import weakref
+from functools import partial, wraps
 from tkinter.constants import *
 from tkinter import filedialog, messagebox, ttk
 
 _LOGGER = logging.getLogger("soulstruct_gui")
 
-_GRID_KEYWORDS = {"column", "columnspan", "in", "ipadx", "ipady", "padx", "pady", "row", "rowspan", "sticky"}
+_GRID_KEYWORDS = frozenset(
+    {"column", "columnspan", "in", "ipadx", "ipady", "padx", "pady", "row", "rowspan", "sticky"}
+)
 
+# Fast-path patterns for `SmartFrame.Entry` validation, matching the common typed forms (and '' or '-') only.
+_INTEGER_ENTRY_RE = re.compile(r"-?\d*")
+_NUMBER_ENTRY_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)?")
+
+# Tcl command names of registered `Entry` validators, per Tk root.
+_VALIDATE_COMMANDS: weakref.WeakKeyDictionary[tk.Misc, dict[tp.Callable[[str], bool], str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Window icon images created from `SmartFrame` `icon_data`, per Tk root, so repeated windows share one decoded image.
+_ICON_IMAGES: weakref.WeakKeyDictionary[tk.Misc, dict[str | bytes, tk.PhotoImage]] = weakref.WeakKeyDictionary()
+
+# Grid position used by `embed_component` when no row/column is given and no auto rows/columns are in effect.
+_DEFAULT_GRID_POSITION = {"row": 0, "column": 0}
+
+# Names of `SmartFrame` widget methods that `SmartFrame.set_master()` can call to create a new master.
+_MASTER_FACTORY_NAMES = frozenset({"Frame", "Toplevel", "Notebook", "Canvas"})
+
+# Existing widget types that `SmartFrame.set_master()` accepts as a master.
+_MASTER_TYPES = (tk.Toplevel, ttk.Notebook, tk.Frame, tk.Canvas)
+
+# Exact widget types whose children are not looked up (with `winfo_children()`) by `SmartFrame.bind_to_all_children()`.
+# SmartFrame never parents widgets to these, so they are always leaves there. Subclasses (and other types) are searched.
+_LEAF_WIDGET_TYPES = frozenset(
+    {tk.Label, tk.Entry, tk.Button, tk.Checkbutton, tk.Radiobutton, tk.Scrollbar, tk.Listbox, ttk.Combobox}
+)
+
+# Set to False before the first `SmartFrame` window is created to leave process DPI awareness alone.
 SET_DPI_AWARENESS = True
-if SET_DPI_AWARENESS:
+_DPI_AWARENESS_SET = False
+
+
+def enable_dpi_awareness():
+    """Make this process DPI-aware on Windows, so GUI fonts are not blurry on scaled displays. Only attempted once.
+
+    Called automatically when the first top-level `SmartFrame` is created (if `SET_DPI_AWARENESS` is True), rather than
+    on import, so that headless imports of this module do not pay for it.
+    """
+    global _DPI_AWARENESS_SET
+    if _DPI_AWARENESS_SET:
+        return
+    _DPI_AWARENESS_SET = True
     try:
+        from ctypes import windll
         windll.shcore.SetProcessDpiAwareness(1)
     except Exception as e:
         _LOGGER.warning(
@@ -37,63 +81,111 @@ class WindowError(Exception):
     """Exception raised by invalid `SmartFrame` state."""
 
 
-def bind_to_all_children(widget: tk.BaseWidget, sequence, func, add=None):
-    """Bind given event to specified widget and all its children, recursively.
+def bind_to_all_children(widget: tk.BaseWidget, sequence, func, add=None, skip_leaf_widgets=False):
+    """Bind given event to specified widget and all its children, recursively (iterative traversal).
 
     No trivial way to unbind them all, so make this is only used for short-lived widget hierarchies.
+
+    If `skip_leaf_widgets` is True, children of `_LEAF_WIDGET_TYPES` widgets (e.g. `Label`, `Entry`) are not searched.
+    Only use it for hierarchies built by `SmartFrame`, which never puts widgets inside those.
     """
-    widget.bind(sequence=sequence, func=func, add=add)
-    for child in widget.winfo_children():
-        bind_to_all_children(child, sequence=sequence, func=func, add=add)
+    stack = [widget]
+    while stack:
+        widget = stack.pop()
+        widget.bind(sequence=sequence, func=func, add=add)
+        if not skip_leaf_widgets or type(widget) not in _LEAF_WIDGET_TYPES:
+            stack.extend(widget.winfo_children())
 
 
-def _bind_to_mousewheel(widget, vertical=True, horizontal=False):
+def _scroll_units(scroll, event):
+    scroll(-(event.delta // 120), "units")
+
+
+def _bind_to_mousewheel(widget, vertical=True, horizontal=False, _event=None):
+    # Scroll methods are bound once here rather than looked up on every (high-frequency) wheel event.
+    # Each `bind_all()` registers a new Tcl command, which `unbind_all()` does not delete, so they are recorded on the
+    # widget for `_unbind_to_mousewheel()` to delete.
+    funcids = []
     if vertical:
-        widget.bind_all("<MouseWheel>", lambda event: widget.yview_scroll(-1 * (event.delta // 120), "units"))
+        funcids.append(widget.bind_all("<MouseWheel>", partial(_scroll_units, widget.yview_scroll)))
     if horizontal:
-        widget.bind_all("<Shift-MouseWheel>", lambda event: widget.xview_scroll(-1 * (event.delta // 120), "units"))
+        funcids.append(widget.bind_all("<Shift-MouseWheel>", partial(_scroll_units, widget.xview_scroll)))
+    widget.mousewheel_funcids = funcids
 
 
-def _unbind_to_mousewheel(widget):
+def _unbind_to_mousewheel(widget, _event=None):
     widget.unbind_all("<MouseWheel>")
     widget.unbind_all("<Shift-MouseWheel>")
+    root = widget._root()  # `bind_all()` registers its commands on the root
+    for funcid in getattr(widget, "mousewheel_funcids", ()):
+        root.deletecommand(funcid)
+    widget.mousewheel_funcids = []
+
+
+def _set_grid_weights(widget: tk.Misc, row_weights: tp.Sequence[int], column_weights: tp.Sequence[int]):
+    """Set all given grid row/column weights of `widget` in a single Tcl evaluation (rather than one call each)."""
+    path = widget._w  # braced below, in case of unusual widget names
+    script = [f"grid rowconfigure {{{path}}} {i} -weight {w:d}" for i, w in enumerate(row_weights)]
+    script += [f"grid columnconfigure {{{path}}} {i} -weight {w:d}" for i, w in enumerate(column_weights)]
+    if script:
+        widget.tk.eval("\n".join(script))
+
+
+class _LabelLayout(tp.NamedTuple):
+    """Grid layout of a component and its label inside their shared frame."""
+    label_grid_kwargs: dict[str, tp.Any]
+    component_grid_kwargs: dict[str, tp.Any]
+    row_weights: tuple[int, ...]
+    column_weights: tuple[int, ...]
+
+
+_LABEL_LAYOUTS = {
+    "left": _LabelLayout({"row": 0, "column": 0, "padx": (0, 2)}, {"row": 0, "column": 1}, (1,), (0, 1)),
+    "right": _LabelLayout({"row": 0, "column": 1, "padx": (2, 0)}, {"row": 0, "column": 0}, (1,), (1, 0)),
+    "above": _LabelLayout({"row": 0, "column": 0}, {"row": 1, "column": 0}, (0, 1), (1,)),
+    "below": _LabelLayout({"row": 1, "column": 0}, {"row": 0, "column": 0}, (1, 0), (1,)),
+}
 
 
 def _grid_label(frame: tk.Frame, label: tk.Label, component, label_position: str):
-    match label_position.lower():
-        case "left":
-            label.grid(row=0, column=0, padx=(0, 2))
-            component.grid(row=0, column=1)
-            frame.rowconfigure(0, weight=1)
-            frame.columnconfigure(0, weight=0)
-            frame.columnconfigure(1, weight=1)
-        case "right":
-            label.grid(row=0, column=1, padx=(2, 0))
-            component.grid(row=0, column=0)
-            frame.rowconfigure(0, weight=1)
-            frame.columnconfigure(0, weight=1)
-            frame.columnconfigure(1, weight=0)
-        case "above":
-            label.grid(row=0, column=0)
-            component.grid(row=1, column=0)
-            frame.rowconfigure(0, weight=0)
-            frame.rowconfigure(1, weight=1)
-            frame.columnconfigure(0, weight=1)
-        case "below":
-            label.grid(row=1, column=0)
-            component.grid(row=0, column=0)
-            frame.rowconfigure(0, weight=1)
-            frame.rowconfigure(1, weight=0)
-            frame.columnconfigure(0, weight=1)
-        case _:
+    try:
+        layout = _LABEL_LAYOUTS[label_position]
+    except KeyError:
+        # Only pay for `lower()` on the rare non-lowercase position.
+        layout = _LABEL_LAYOUTS.get(label_position.lower())
+        if layout is None:
             raise ValueError(
                 f"Invalid label position: {repr(label_position)}. Must be 'left', 'right', 'above', or 'below'."
             )
+    label_grid_kwargs, component_grid_kwargs, row_weights, column_weights = layout
+    label.grid(**label_grid_kwargs)
+    component.grid(**component_grid_kwargs)
+    _set_grid_weights(frame, row_weights, column_weights)
+
+
+def _add_scrollbars(frame_with_scrollbars: tk.Frame, component, vertical: bool, horizontal: bool):
+    """Grid `component` inside `frame_with_scrollbars` alongside the requested scrollbars."""
+    component.grid(row=0, column=0, sticky="nsew")
+    if vertical:
+        vertical_scrollbar_w = tk.Scrollbar(frame_with_scrollbars, orient=VERTICAL, command=component.yview)
+        vertical_scrollbar_w.grid(row=0, column=1, sticky=NS)
+        component.config(bd=0, yscrollcommand=vertical_scrollbar_w.set)
+    if horizontal:
+        horizontal_scrollbar_w = tk.Scrollbar(frame_with_scrollbars, orient=HORIZONTAL, command=component.xview)
+        horizontal_scrollbar_w.grid(row=1, column=0, sticky=EW)
+        component.config(bd=0, xscrollcommand=horizontal_scrollbar_w.set)
+    # Partials of module-level functions, rather than new closures for every scrollable component.
+    component.bind("<Enter>", partial(_bind_to_mousewheel, component, vertical, horizontal))
+    component.bind("<Leave>", partial(_unbind_to_mousewheel, component))
+    _set_grid_weights(frame_with_scrollbars, (1, 0) if horizontal else (1,), (1, 0) if vertical else (1,))
 
 
 def embed_component(component_func):
     """Handles labels and scrollbars for decorated `SmartFrame` methods."""
 
+    # Resolved once per decorated method, at class definition time.
+    default_label_position = "left" if component_func.__name__ in {"Checkbutton", "Entry"} else "above"
+
     @wraps(component_func)
     def component_with_label(
         self: SmartFrame,
@@ -110,37 +202,56 @@ def embed_component(component_func):
         **grid_style_component_kwargs,
     ):
 
-        grid_kwargs = self.grid_defaults.copy()
         passed_grid_kwargs = {
             key: grid_style_component_kwargs.pop(key)
-            for key in list(grid_style_component_kwargs.keys())
-            if key in _GRID_KEYWORDS
+            for key in grid_style_component_kwargs.keys() & _GRID_KEYWORDS
         }
-        if passed_grid_kwargs and no_grid:
-            raise ValueError("If 'no_grid' is True, no grid keyword arguments can be used.")
-        grid_kwargs.update(passed_grid_kwargs)
-
-        for dim in {"row", "column"}:
-            current_dim = getattr(self, "current_" + dim)
-            if dim not in grid_kwargs:
-                if current_dim is None:
-                    grid_kwargs[dim] = 0
+        if no_grid:
+            if passed_grid_kwargs:
+                raise ValueError("If 'no_grid' is True, no grid keyword arguments can be used.")
+            # Widget will not be gridded, so it should not consume an auto row/column either.
+            grid_kwargs = {}
+        elif self.current_row is None and self.current_column is None:
+            # No auto rows/columns in effect (static layouts): unspecified row/column just default to 0.
+            grid_kwargs = _DEFAULT_GRID_POSITION | self.grid_defaults | passed_grid_kwargs
+        else:
+            grid_kwargs = self.grid_defaults | passed_grid_kwargs
+            # Rows and columns handled separately (rather than in a loop over `getattr`) on this hot path.
+            current_row = self.current_row
+            if "row" not in grid_kwargs:
+                if current_row is None:
+                    grid_kwargs["row"] = 0
+                else:
+                    grid_kwargs["row"] = current_row
+                    self.current_row = current_row + 1
+            elif current_row is not None:
+                raise ValueError("You cannot specify row with a keyword while auto_rows is in effect.")
+            current_column = self.current_column
+            if "column" not in grid_kwargs:
+                if current_column is None:
+                    grid_kwargs["column"] = 0
                 else:
-                    grid_kwargs[dim] = current_dim
-                    setattr(self, "current_" + dim, current_dim + 1)
-            elif current_dim is not None:
-                raise ValueError(f"You cannot specify {dim} with a keyword while auto_{dim}s is in effect.")
+                    grid_kwargs["column"] = current_column
+                    self.current_column = current_column + 1
+            elif current_column is not None:
+                raise ValueError("You cannot specify column with a keyword while auto_columns is in effect.")
 
         if frame is None:
             frame = self.current_frame or self.master_frame
 
-        if label_position is None:
-            if component_func.__name__ in {"Checkbutton", "Entry"}:
-                label_position = "left"
-            else:
-                label_position = "above"
+        if not label and not vertical_scrollbar and not horizontal_scrollbar:
+            # Fast path for the most common case: plain widget gridded directly into `frame`.
+            component = component_func(self, frame=frame, **grid_style_component_kwargs)
+            if not no_grid and grid_kwargs:
+                component.grid(**grid_kwargs)
+            if tooltip_text:
+                ToolTip(component, text=tooltip_text)
+            return component
 
+        inherit_bg = None
         if label:
+            if label_position is None:
+                label_position = default_label_position
             if label_bg is None:
                 label_bg = grid_style_component_kwargs.get("bg", self.STYLE_DEFAULTS["bg"])
             if label_fg is None:
@@ -151,44 +262,21 @@ def embed_component(component_func):
             label = tk.Label(frame, text=label, font=label_font, fg=label_fg, bg=label_bg)
 
         if vertical_scrollbar or horizontal_scrollbar:
-            inherit_bg = frame.cget("bg")
-            frame_with_scrollbars = tk.Frame(frame, bg=inherit_bg)
-            component = component_func(self, frame=frame_with_scrollbars, **grid_style_component_kwargs)
-            component.grid(row=0, column=0, sticky="nsew")
-            if vertical_scrollbar:
-                vertical_scrollbar_w = tk.Scrollbar(frame_with_scrollbars, orient=VERTICAL, command=component.yview)
-                vertical_scrollbar_w.grid(row=0, column=1, sticky=NS)
-                component.config(bd=0, yscrollcommand=vertical_scrollbar_w.set)
-            if horizontal_scrollbar:
-                horizontal_scrollbar_w = tk.Scrollbar(frame_with_scrollbars, orient=HORIZONTAL, command=component.xview)
-                horizontal_scrollbar_w.grid(row=1, column=0, sticky=EW)
-                component.config(bd=0, xscrollcommand=horizontal_scrollbar_w.set)
-            component.bind(
-                "<Enter>", lambda _, f=component: _bind_to_mousewheel(f, vertical_scrollbar, horizontal_scrollbar)
-            )
-            component.bind("<Leave>", lambda _, f=component: _unbind_to_mousewheel(f))
-            frame_with_scrollbars.rowconfigure(0, weight=1)
-            if horizontal_scrollbar:
-                frame_with_scrollbars.rowconfigure(1, weight=0)
-            frame_with_scrollbars.columnconfigure(0, weight=1)
-            if vertical_scrollbar:
-                frame_with_scrollbars.columnconfigure(1, weight=0)
-            if label:
-                _grid_label(frame, label, frame_with_scrollbars, label_position)
-                if not no_grid and grid_kwargs:
-                    frame.grid(**grid_kwargs)
-                component.label = label
-            elif not no_grid and grid_kwargs:
-                frame_with_scrollbars.grid(**grid_kwargs)
+            if inherit_bg is None:
+                inherit_bg = frame.cget("bg")  # label frame (if any) already has the same `bg`
+            outer_widget = tk.Frame(frame, bg=inherit_bg)
+            component = component_func(self, frame=outer_widget, **grid_style_component_kwargs)
+            _add_scrollbars(outer_widget, component, vertical_scrollbar, horizontal_scrollbar)
         else:
-            component = component_func(self, frame=frame, **grid_style_component_kwargs)
-            if label:
-                _grid_label(frame, label, component, label_position)
-                if not no_grid and grid_kwargs:
-                    frame.grid(**grid_kwargs)
-                component.label = label
-            elif not no_grid and grid_kwargs:
-                component.grid(**grid_kwargs)
+            component = outer_widget = component_func(self, frame=frame, **grid_style_component_kwargs)
+
+        if label:
+            _grid_label(frame, label, outer_widget, label_position)
+            if not no_grid and grid_kwargs:
+                frame.grid(**grid_kwargs)
+            component.label = label
+        elif not no_grid and grid_kwargs:
+            outer_widget.grid(**grid_kwargs)
 
         if tooltip_text:
             ToolTip(component, text=tooltip_text)
@@ -204,6 +292,18 @@ BOLD_FONT = ("Inconsolata Bold", 14)
 HEADING_FONT = ("Inconsolata Bold", 18)
 
 
+# Base64 GIF data (48x24) for `SmartFrame.Checkbutton` images: a black box with a 23x23 green square on the right
+# (on) or a red square on the left (off), leaving a one-pixel black border on the right and bottom edges.
+_ON_IMAGE_GIF = (
+    "R0lGODdhMAAYAIEAAAAAAET/RAAAAAAAACwAAAAAMAAYAEAIbAABCBxIsKDBgQESKlzIsGHCgxAjAnBIkaLEiwQralyIsePGjx0xftwY"
+    "8uJIjSUlnqyYMuJKiy0PvnQYU+ZMhjUN3sSZM+NOhT19/gwQFOFQokUnHk2qdCjTo0iLQn26NOlUq1WlZg16lWnQgAA7"
+)
+_OFF_IMAGE_GIF = (
+    "R0lGODdhMAAYAIEAAAAAAN1mZgAAAAAAACwAAAAAMAAYAEAIbAADCBxIsKBBgQASKlzIsOHCgxAhOpxIEUDEiwQranyIEePGjx09ftQY"
+    "8uJIkiUlnqSYUuVKhy0PvpwY0+BMmDUz3mSYU+dOhT0H/uQYdCjQoAGMJkSaVClTpRaRQn3qVGrVold7TrUKtevOgAA7"
+)
+
+
 # Widget types that can be set as the `frame` argument of `SmartFrame` widget wrapper methods.
 MASTER_TYPING = tp.Union[tk.Frame, tk.Toplevel, ttk.Notebook, tk.Canvas, None]
 
@@ -211,6 +311,87 @@ MASTER_TYPING = tp.Union[tk.Frame, tk.Toplevel, ttk.Notebook, tk.Canvas, None]
 FONT_TYPING = tuple[str | None, int | None] | str | int | None
 
 
+class _MasterContext:
+    """Context manager returned by `SmartFrame.set_master()`.
+
+    A plain class rather than `contextlib.contextmanager`, as `set_master()` is entered for nearly every layout block.
+    As before, nothing happens until the `with` block is entered.
+    """
+
+    __slots__ = (
+        "smart_frame",
+        "master",
+        "auto_rows",
+        "auto_columns",
+        "grid_defaults",
+        "frame_kwargs",
+        "previous_frame",
+        "previous_auto_row",
+        "previous_auto_column",
+        "previous_grid_defaults",
+    )
+
+    def __init__(
+        self,
+        smart_frame: SmartFrame,
+        master: MASTER_TYPING | tp.Callable | str | None,
+        auto_rows: int | None,
+        auto_columns: int | None,
+        grid_defaults: dict[str, tp.Any] | None,
+        frame_kwargs: dict[str, tp.Any],
+    ):
+        self.smart_frame = smart_frame
+        self.master = master
+        self.auto_rows = auto_rows
+        self.auto_columns = auto_columns
+        self.grid_defaults = grid_defaults
+        self.frame_kwargs = frame_kwargs
+
+    def __enter__(self):
+        smart_frame = self.smart_frame
+        master = self.master
+        frame_kwargs = self.frame_kwargs
+
+        if master is None:
+            new_frame = smart_frame.Frame(**frame_kwargs)
+        else:
+            if isinstance(master, str):
+                try:
+                    master = getattr(smart_frame, master)
+                except AttributeError:
+                    raise ValueError(
+                        f"Invalid master type string: {master}. Must be one of: Frame, Toplevel, Notebook, Canvas"
+                    )
+            if getattr(master, "__self__", None) is smart_frame and master.__name__ in _MASTER_FACTORY_NAMES:
+                new_frame = master(**frame_kwargs)
+            elif isinstance(master, _MASTER_TYPES):
+                if frame_kwargs:
+                    raise ValueError("Cannot use `set_master` keyword arguments when passing an existing `master`.")
+                new_frame = master
+            else:
+                raise TypeError("`master` can only be set to a Toplevel, Notebook, Frame, or Canvas.")
+
+        self.previous_frame = smart_frame.current_frame
+        self.previous_auto_row = smart_frame.current_row
+        self.previous_auto_column = smart_frame.current_column
+        # `grid_defaults` dicts are never mutated in place, so the previous one can be restored without a copy.
+        self.previous_grid_defaults = smart_frame.grid_defaults
+
+        smart_frame.current_frame = new_frame
+        smart_frame.current_row = self.auto_rows
+        smart_frame.current_column = self.auto_columns
+        if self.grid_defaults is not None:
+            smart_frame.grid_defaults = self.grid_defaults
+        return new_frame
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        smart_frame = self.smart_frame
+        smart_frame.current_row = self.previous_auto_row
+        smart_frame.current_column = self.previous_auto_column
+        smart_frame.grid_defaults = self.previous_grid_defaults
+        smart_frame.current_frame = self.previous_frame
+
+
 # noinspection PyPep8Naming
 class SmartFrame(tk.Frame):
     FONT_DEFAULTS = {
@@ -244,8 +425,14 @@ class SmartFrame(tk.Frame):
         "NO": {"fg": "#FFFFFF", "bg": "#444444", "width": 20},
     }
 
+    # Created by `_ensure_check_images()` when the first `Checkbutton()` is built, not with every window.
     _ON_IMAGE: tk.PhotoImage | None = None
     _OFF_IMAGE: tk.PhotoImage | None = None
+    # Default `tk.Checkbutton` kwargs for `Checkbutton()` (caller kwargs take precedence), built with the images above.
+    _CHECKBUTTON_KWARGS: dict[str, tp.Any] | None = None
+    # `ttk` styles are shared by every widget in a Tcl interpreter, so `set_ttk_style()` records what it last applied
+    # (interpreter, background, tab font, label font) and skips repeat work for later windows.
+    _TTK_STYLE_APPLIED: tuple | None = None
 
     toplevel: tk.Toplevel | None
     style: ttk.Style
@@ -254,22 +441,31 @@ class SmartFrame(tk.Frame):
     current_column: int | None
     master_frame: tk.Frame
     current_frame: tk.Frame
+    _style_default_items: dict[tuple[bool, bool, bool], tuple[tuple[str, tp.Any], ...]]
 
     def __init__(self, master=None, toplevel=True, window_title="Window Title", icon_data=None, **frame_kwargs):
         """My ultimate `tkinter` wrapper class."""
 
+        # `STYLE_DEFAULTS` may be overridden per instance before this is called (e.g. by dialogs), so cache here.
+        self._style_default_items = {}
+
         # Initialize window.
         toplevel_master = master
         if toplevel:
+            if SET_DPI_AWARENESS and not _DPI_AWARENESS_SET:
+                enable_dpi_awareness()  # before any window is shown
             master = self.toplevel = tk.Toplevel(master)
             self.toplevel.title(window_title)
             self.toplevel.iconname(window_title)
             self.toplevel.focus_force()
-            self.toplevel.rowconfigure(0, weight=1)
-            self.toplevel.columnconfigure(0, weight=1)
+            _set_grid_weights(self.toplevel, (1,), (1,))
             super().__init__(master, **frame_kwargs)
             if icon_data is not None:
-                self.icon = tk.PhotoImage(data=icon_data)
+                root_icons = _ICON_IMAGES.setdefault(self._root(), {})
+                try:
+                    self.icon = root_icons[icon_data]
+                except KeyError:
+                    self.icon = root_icons[icon_data] = tk.PhotoImage(master=self._root(), data=icon_data)
                 # noinspection PyProtectedMember,PyUnresolvedReferences
                 self.toplevel.tk.call("wm", "iconphoto", self.toplevel._w, self.icon)
             self.grid(sticky="nsew")
@@ -283,22 +479,11 @@ class SmartFrame(tk.Frame):
         self.current_row = None
         self.current_column = None
 
-        # Create class-level checkbutton images, if missing.
-        if self._ON_IMAGE is None:
-            self.__class__._ON_IMAGE = tk.PhotoImage(width=48, height=24)
-            self.__class__._ON_IMAGE.put(("#000",), to=(0, 0, 48, 24))  # black
-            self.__class__._ON_IMAGE.put(("#4F4",), to=(24, 0, 47, 23))  # green (right)
-        if self._OFF_IMAGE is None:
-            self.__class__._OFF_IMAGE = tk.PhotoImage(width=48, height=24)
-            self.__class__._OFF_IMAGE.put(("#000",), to=(0, 0, 48, 24))  # black
-            self.__class__._OFF_IMAGE.put(("#D66",), to=(0, 0, 23, 23))  # red (left)
-
         # Current frame tracked, defaults to master frame.
         self.master_frame = self.current_frame = self.Frame(
             frame=self, row=0, column=0, sticky="nsew", row_weights=[1], column_weights=[1]
         )
-        self.rowconfigure(0, weight=1)
-        self.columnconfigure(0, weight=1)
+        _set_grid_weights(self, (1,), (1,))
 
         # Disable default root if used.
         if self.toplevel and toplevel_master is None:
@@ -377,13 +562,19 @@ class SmartFrame(tk.Frame):
         self.toplevel.withdraw()  # Remain invisible while we figure out the geometry
         if transient:
             self.toplevel.transient(master)
-        self.toplevel.update_idletasks()  # Actualize geometry information
+        if dimensions is None or relative_position is not None:
+            # Actualize geometry information (only needed for requested size or current master geometry).
+            self.toplevel.update_idletasks()
 
         if dimensions is not None:
             w_width, w_height = int(dimensions[0]), int(dimensions[1])
         else:
             w_width, w_height = self.toplevel.winfo_reqwidth(), self.toplevel.winfo_reqheight()
 
+        # Each `winfo_*` call is a Tcl round-trip, so screen size is only queried once.
+        screen_width = master.winfo_screenwidth()
+        screen_height = master.winfo_screenheight()
+
         if relative_position is not None and master.winfo_ismapped():
             rel_x, rel_y = relative_position
             m_width = master.winfo_width()
@@ -393,43 +584,71 @@ class SmartFrame(tk.Frame):
             w_x = int(m_x + (m_width - w_width) * rel_x)
             w_y = int(m_y + (m_height - w_height) * rel_y)
         else:
-            m_width = master.winfo_screenwidth()
-            m_height = master.winfo_screenheight()
             if absolute_position is None:
-                absolute_position = (m_width / 2, m_height / 2)
+                absolute_position = (screen_width / 2, screen_height / 2)
             w_x = int(absolute_position[0] - (w_width / 2))
             w_y = int(absolute_position[1] - (w_height / 2))
 
         # Ensure that this window does not go off the screen.
-        if w_x + w_width > master.winfo_screenwidth():
-            w_x = master.winfo_screenwidth() - w_width
+        if w_x + w_width > screen_width:
+            w_x = screen_width - w_width
         elif w_x < 0:
             w_x = 0
-        if w_y + w_height > master.winfo_screenheight():
-            w_y = master.winfo_screenheight() - w_height
+        if w_y + w_height > screen_height:
+            w_y = screen_height - w_height
         elif w_y < 0:
             w_y = 0
         self.toplevel.geometry(f"{w_width:d}x{w_height:d}+{w_x:d}+{w_y:d}")
         self.toplevel.deiconify()  # become visible at the desired location
 
+    @classmethod
+    def _ensure_check_images(cls) -> dict[str, tp.Any]:
+        """Create the shared checkbutton images (and `_CHECKBUTTON_KWARGS`) if missing, and return those kwargs.
+
+        Stored on `SmartFrame` itself so that all subclasses share them.
+        """
+        if SmartFrame._CHECKBUTTON_KWARGS is None:
+            SmartFrame._ON_IMAGE = tk.PhotoImage(data=_ON_IMAGE_GIF)
+            SmartFrame._OFF_IMAGE = tk.PhotoImage(data=_OFF_IMAGE_GIF)
+            SmartFrame._CHECKBUTTON_KWARGS = {
+                "image": SmartFrame._OFF_IMAGE,
+                "selectimage": SmartFrame._ON_IMAGE,
+                "indicatoron": False,
+                "borderwidth": 0,
+                "bg": "#444",
+                "selectcolor": "#444",
+            }
+        return SmartFrame._CHECKBUTTON_KWARGS
+
     def set_ttk_style(self):
-        self.style.theme_use("clam")
-        self.style.configure(
-            "TNotebook", background=self.STYLE_DEFAULTS["bg"], tabmargins=[2, 10, 2, 0], tabposition="nw"
-        )
-        self.style.configure(
-            "TNotebook.Tab", background="#333", foreground="#FFF", padding=[15, 1], font=(self.FONT_DEFAULTS["tab"])
-        )
-        self.style.map("TNotebook.Tab", background=[("selected", "#555")], expand=[("selected", [5, 3, 3, 0])])
-        self.style.configure(
-            "TCombobox", foreground="#FFF",
-        )
-        self.style.map(
-            "TCombobox", fieldbackground=[("readonly", "#222")], selectedbackground=[("readonly", "#222")],
+        """Apply `ttk` theme and styles, issued as a single Tcl script rather than one call per command.
+
+        Does nothing if the same styles have already been applied to this Tcl interpreter by another `SmartFrame`.
+        """
+        applied = (self.tk, self.STYLE_DEFAULTS["bg"], self.FONT_DEFAULTS["tab"], self.FONT_DEFAULTS["label"])
+        previous = SmartFrame._TTK_STYLE_APPLIED
+        if previous is not None and previous[0] is applied[0] and previous[1:] == applied[1:]:
+            return
+        # Values are passed as arguments to an anonymous Tcl procedure, so `tk.call()` quotes them.
+        script = "\n".join((
+            "ttk::setTheme clam",
+            "ttk::style configure TNotebook -background $bg -tabmargins {2 10 2 0} -tabposition nw",
+            "ttk::style configure TNotebook.Tab -background #333 -foreground #FFF -padding {15 1} -font $tabFont",
+            "ttk::style map TNotebook.Tab -background {selected #555} -expand {selected {5 3 3 0}}",
+            "ttk::style configure TCombobox -foreground #FFF",
+            "ttk::style map TCombobox -fieldbackground {readonly #222} -selectedbackground {readonly #222}",
+            "option add *TCombobox*Listbox*background #222",
+            "option add *TCombobox*Listbox*font $labelFont",
+            "option add *TCombobox*Listbox*foreground #FFF",
+        ))
+        self.tk.call(
+            "apply",
+            ("bg tabFont labelFont", script),
+            self.STYLE_DEFAULTS["bg"],
+            self.FONT_DEFAULTS["tab"],
+            self.FONT_DEFAULTS["label"],
         )
-        self.option_add("*TCombobox*Listbox*background", "#222")
-        self.option_add("*TCombobox*Listbox*font", (self.FONT_DEFAULTS["label"]))
-        self.option_add("*TCombobox*Listbox*foreground", "#FFF")
+        SmartFrame._TTK_STYLE_APPLIED = applied
 
     def start_auto_rows(self, start=0):
         self.current_row = start
@@ -445,32 +664,48 @@ class SmartFrame(tk.Frame):
 
     def get_style_kwargs(self, kwargs_dict) -> dict[str, tp.Any]:
         """Return a new dictionary that contains only keywords relevant to style (and also 'font')."""
-        return {k: v for k, v in kwargs_dict.items() if k in self.STYLE_DEFAULTS or k == "font"}
+        style_defaults = self.STYLE_DEFAULTS  # may be overridden per instance, so not frozen at class level
+        return {k: v for k, v in kwargs_dict.items() if k in style_defaults or k == "font"}
 
     def set_style_defaults(self, kwargs_dict, text=False, cursor=False, entry=False):
-        kwargs_dict.setdefault("bg", self.STYLE_DEFAULTS.get("bg", None))
+        for key, value in self._get_style_default_items(text, cursor, entry):
+            kwargs_dict.setdefault(key, value)
+
+    def _get_style_default_items(self, text: bool, cursor: bool, entry: bool) -> tuple[tuple[str, tp.Any], ...]:
+        """Style default `(key, value)` pairs for the given flags, resolved once per flag combination."""
+        cache_key = (text, cursor, entry)
+        try:
+            return self._style_default_items[cache_key]
+        except KeyError:
+            pass
+        items = [("bg", self.STYLE_DEFAULTS.get("bg", None))]
         if text:
-            kwargs_dict.setdefault("fg", self.STYLE_DEFAULTS.get("fg", None))
+            items.append(("fg", self.STYLE_DEFAULTS.get("fg", None)))
         if cursor:
-            kwargs_dict.setdefault("insertbackground", self.STYLE_DEFAULTS.get("insertbackground", None))
+            items.append(("insertbackground", self.STYLE_DEFAULTS.get("insertbackground", None)))
         if entry:
-            kwargs_dict.setdefault("disabledforeground", self.STYLE_DEFAULTS.get("disabledforeground", None))
-            kwargs_dict.setdefault("disabledbackground", self.STYLE_DEFAULTS.get("disabledbackground", None))
-            kwargs_dict.setdefault("readonlybackground", self.STYLE_DEFAULTS.get("readonlybackground", None))
-            kwargs_dict.setdefault("font", self.FONT_DEFAULTS.get("entry", None))
+            items.append(("disabledforeground", self.STYLE_DEFAULTS.get("disabledforeground", None)))
+            items.append(("disabledbackground", self.STYLE_DEFAULTS.get("disabledbackground", None)))
+            items.append(("readonlybackground", self.STYLE_DEFAULTS.get("readonlybackground", None)))
+            items.append(("font", self.FONT_DEFAULTS.get("entry", None)))
+        items = self._style_default_items[cache_key] = tuple(items)
+        return items
 
     def resolve_font(
         self, font: tuple[str | None, int | None] | str | int | None, default_key: str = "label"
     ) -> tuple[str, int]:
+        default_font = self.FONT_DEFAULTS[default_key]
         if font is None:
-            return self.FONT_DEFAULTS[default_key]
+            return default_font
         if isinstance(font, int):
-            return self.FONT_DEFAULTS[default_key][0], font
+            return default_font[0], font
         if isinstance(font, str):
-            return font, self.FONT_DEFAULTS[default_key][1]
+            return font, default_font[1]
+        if isinstance(font, tuple) and font[0] and font[1]:
+            return font  # already fully resolved
         return (
-            font[0] if font[0] else self.FONT_DEFAULTS[default_key][0],
-            font[1] if font[1] else self.FONT_DEFAULTS[default_key][1],
+            font[0] if font[0] else default_font[0],
+            font[1] if font[1] else default_font[1],
         )
 
     # region Variables
@@ -503,10 +738,7 @@ class SmartFrame(tk.Frame):
         kwargs.setdefault("bg", self.STYLE_DEFAULTS["bg"])
         toplevel = tk.Toplevel(frame, **kwargs)
         toplevel.title(title)
-        for i, w in enumerate(row_weights):
-            toplevel.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            toplevel.columnconfigure(i, weight=w)
+        _set_grid_weights(toplevel, row_weights, column_weights)
         return toplevel
 
     @embed_component
@@ -518,10 +750,7 @@ class SmartFrame(tk.Frame):
         **kwargs,
     ):
         notebook = ttk.Notebook(frame, **kwargs)
-        for i, w in enumerate(row_weights):
-            notebook.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            notebook.columnconfigure(i, weight=w)
+        _set_grid_weights(notebook, row_weights, column_weights)
         return notebook
 
     @embed_component
@@ -534,10 +763,7 @@ class SmartFrame(tk.Frame):
     ):
         self.set_style_defaults(kwargs)
         frame = tk.Frame(frame, **kwargs)
-        for i, w in enumerate(row_weights):
-            frame.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            frame.columnconfigure(i, weight=w)
+        _set_grid_weights(frame, row_weights, column_weights)
         return frame
 
     @embed_component
@@ -554,10 +780,7 @@ class SmartFrame(tk.Frame):
         elif not issubclass(smart_frame_class, SmartFrame):
             raise TypeError(f"`smart_frame_class` must be a subclass of `SmartFrame`, not {smart_frame_class}.")
         smart_frame = smart_frame_class(master=frame, **kwargs)
-        for i, w in enumerate(row_weights):
-            smart_frame.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            smart_frame.columnconfigure(i, weight=w)
+        _set_grid_weights(smart_frame, row_weights, column_weights)
         return smart_frame
 
     @embed_component
@@ -570,10 +793,7 @@ class SmartFrame(tk.Frame):
     ):
         self.set_style_defaults(kwargs)
         canvas = tk.Canvas(frame, **kwargs)
-        for i, w in enumerate(row_weights):
-            canvas.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            canvas.columnconfigure(i, weight=w)
+        _set_grid_weights(canvas, row_weights, column_weights)
         return canvas
 
     @embed_component
@@ -591,7 +811,7 @@ class SmartFrame(tk.Frame):
         self.set_style_defaults(kwargs, text=True)
         font = self.resolve_font(font, "button")
         if text is not None:
-            text_var = tk.StringVar(value=text)
+            text_var = tk.StringVar(frame, value=text)
         else:
             text_var = None
         if style is not None:
@@ -620,20 +840,13 @@ class SmartFrame(tk.Frame):
         text="",
         **kwargs,
     ):
-        self.set_style_defaults(kwargs)
-        boolean_var = tk.BooleanVar(value=initial_state)
-        kwargs["bg"] = "#444"
-        kwargs["selectcolor"] = "#444"
+        boolean_var = tk.BooleanVar(frame, value=initial_state)
         checkbutton = tk.Checkbutton(
             frame,
             text=text,
             variable=boolean_var,
             command=command,
-            image=self._OFF_IMAGE,
-            selectimage=self._ON_IMAGE,
-            indicatoron=False,
-            borderwidth=0,
-            **kwargs,
+            **(self._ensure_check_images() | kwargs),  # caller's `bg`, `selectcolor`, etc. win
         )
         checkbutton.var = boolean_var
         return checkbutton
@@ -649,7 +862,7 @@ class SmartFrame(tk.Frame):
     ):
         """Default checkbutton style, with a box and tick."""
         self.set_style_defaults(kwargs)
-        boolean_var = tk.BooleanVar(value=initial_state)
+        boolean_var = tk.BooleanVar(frame, value=initial_state)
         checkbutton = tk.Checkbutton(frame, text=text, variable=boolean_var, command=command, **kwargs)
         checkbutton.var = boolean_var
         return checkbutton
@@ -681,9 +894,7 @@ class SmartFrame(tk.Frame):
         **kwargs,
     ):
         frame = frame or self.current_frame
-        for key in self.MENU_STYLE_DEFAULTS:
-            kwargs.setdefault(key, self.MENU_STYLE_DEFAULTS[key])
-        menu = SmartMenu(frame, tearoff=tearoff, **kwargs)
+        menu = SmartMenu(frame, tearoff=tearoff, **(self.MENU_STYLE_DEFAULTS | kwargs))
         return menu
 
     @embed_component
@@ -710,17 +921,17 @@ class SmartFrame(tk.Frame):
                 "argument is not mistaken for `initial_text`."
             )
         self.set_style_defaults(kwargs, text=True, cursor=True, entry=True)
-        text_var = tk.StringVar(value=initial_text)
+        text_var = tk.StringVar(frame, value=initial_text)
         entry = tk.Entry(frame, textvariable=text_var, **kwargs)
         entry.var = text_var
         entry.integers_only = integers_only
         if integers_only:
             if numbers_only:
                 raise ValueError("Use `integers_only` or `numbers_only`, but not both.")
-            v_cmd = (self.master.register(self._validate_entry_integers), "%P")
+            v_cmd = (self._get_validate_command(self._validate_entry_integers), "%P")
             entry.config(validate="key", validatecommand=v_cmd)
         elif numbers_only:
-            v_cmd = (self.master.register(self._validate_entry_numbers), "%P")
+            v_cmd = (self._get_validate_command(self._validate_entry_numbers), "%P")
             entry.config(validate="key", validatecommand=v_cmd)
         return entry
 
@@ -730,12 +941,21 @@ class SmartFrame(tk.Frame):
         frame: MASTER_TYPING = None,
         text="",
         font: FONT_TYPING = None,
+        mutable=True,
         **kwargs,
     ):
+        """Label whose text is held in a `StringVar` (`label.var`), unless `mutable=False` and `text` is a string.
+
+        Static labels should use `mutable=False`, which skips creating the Tcl variable. Their `var` is `None`.
+        """
         self.set_style_defaults(kwargs, text=True)
         font = self.resolve_font(font, "label")
+        if not mutable and isinstance(text, str):
+            label = tk.Label(frame, text=text, font=font, **kwargs)
+            label.var = None
+            return label
         if isinstance(text, str):
-            string_var = tk.StringVar(value=text)
+            string_var = tk.StringVar(frame, value=text)
         elif isinstance(text, tk.StringVar):
             string_var = text
         else:
@@ -754,8 +974,8 @@ class SmartFrame(tk.Frame):
     ):
         self.set_style_defaults(kwargs, text=True)
         listbox = tk.Listbox(frame, **kwargs)
-        for value in values:
-            listbox.insert(END, value)
+        if values:
+            listbox.insert(END, *values)  # single Tcl call
         if on_select_function is not None:
             listbox.bind("<<ListboxSelect>>", on_select_function)
         return listbox
@@ -779,7 +999,7 @@ class SmartFrame(tk.Frame):
         **kwargs,
     ):
         self.set_style_defaults(kwargs)
-        variable = variable or tk.IntVar()
+        variable = variable or tk.IntVar(frame)
         radiobutton = tk.Radiobutton(frame, text="", variable=variable, command=command, **kwargs)
         radiobutton.var = variable
         return radiobutton
@@ -814,7 +1034,8 @@ class SmartFrame(tk.Frame):
     ):
         self.set_style_defaults(kwargs)
         if variable is None:
-            variable = tk.DoubleVar() if is_float else tk.IntVar()  # will default to `IntVar` if `is_float=None`
+            # Will default to `IntVar` if `is_float=None`.
+            variable = tk.DoubleVar(frame) if is_float else tk.IntVar(frame)
         elif is_float is not None:
             raise ValueError("Cannot pass `is_float` keyword for `SmartFrame.Scale` if `variable` is given.")
         scale = tk.Scale(frame, from_=limits[0], to=limits[1], orient=orientation, variable=variable, **kwargs)
@@ -830,7 +1051,10 @@ class SmartFrame(tk.Frame):
     ):
         self.set_style_defaults(kwargs, text=True, cursor=True, entry=False)
         text_box = tk.Text(frame, **kwargs)
-        text_box.insert(1.0, initial_text)
+        if initial_text:
+            text_box.insert(1.0, initial_text)
+            if kwargs.get("undo"):
+                text_box.edit_reset()  # initial text should not be undoable
         return text_box
 
     @embed_component
@@ -846,13 +1070,14 @@ class SmartFrame(tk.Frame):
         if custom_widget_class is None:
             # optional `frame` argument must come first for decorator, so this is required.
             raise ValueError("`custom_widget_class` cannot be None.")
-        style_default_kwargs = {k: k in set_style_defaults for k in ("text", "cursor", "entry")}
-        self.set_style_defaults(kwargs, **style_default_kwargs)
+        self.set_style_defaults(
+            kwargs,
+            text="text" in set_style_defaults,
+            cursor="cursor" in set_style_defaults,
+            entry="entry" in set_style_defaults,
+        )
         custom_widget = custom_widget_class(frame, **kwargs)
-        for i, w in enumerate(row_weights):
-            custom_widget.rowconfigure(i, weight=w)
-        for i, w in enumerate(column_weights):
-            custom_widget.columnconfigure(i, weight=w)
+        _set_grid_weights(custom_widget, row_weights, column_weights)
         return custom_widget
 
     def LoadingDialog(
@@ -947,22 +1172,21 @@ class SmartFrame(tk.Frame):
 
     @staticmethod
     def mimic_click(button: tk.Button):
-        button["relief"] = SUNKEN
+        button.configure(relief=SUNKEN)
         button.update_idletasks()
-        button.after(100, lambda: button.config(relief=RAISED))
+        button.after(100, partial(button.configure, relief=RAISED))
 
     def flash_bg(self, widget, bg="#522", ms=100):
         if getattr(widget, "flashing", False):
             return  # already flashing
-        old_bg = widget["bg"]
-        widget["bg"] = bg
+        old_bg = widget.cget("bg")
+        widget.configure(bg=bg)
         widget.flashing = True
-        widget.update_idletasks()
-        widget.after(ms, lambda w=widget, o=old_bg: self._end_flash(w, o))
+        widget.after(ms, self._end_flash, widget, old_bg)  # `after()` forwards positional args to the callback
 
     @staticmethod
     def _end_flash(widget, old_bg):
-        widget["bg"] = old_bg
+        widget.configure(bg=old_bg)
         widget.flashing = False
 
     @staticmethod
@@ -973,12 +1197,15 @@ class SmartFrame(tk.Frame):
     @staticmethod
     def link_to_scrollable(scrollable_widget, *widgets):
         """Registers <Enter> and <Leave> events that enable scrolling for the first widget for all following widgets."""
+        # One pair of callbacks shared by all `widgets`, rather than new closures for each.
+        on_enter = partial(_bind_to_mousewheel, scrollable_widget, True, False)
+        on_leave = partial(_unbind_to_mousewheel, scrollable_widget)
         for widget in widgets:
-            widget.bind("<Enter>", lambda _, f=scrollable_widget: _bind_to_mousewheel(f))
-            widget.bind("<Leave>", lambda _, f=scrollable_widget: _unbind_to_mousewheel(f))
+            widget.bind("<Enter>", on_enter)
+            widget.bind("<Leave>", on_leave)
 
     def bind_to_all_children(self, sequence, func, add=None):
-        bind_to_all_children(self, sequence=sequence, func=func, add=add)
+        bind_to_all_children(self, sequence=sequence, func=func, add=add, skip_leaf_widgets=True)
 
     @staticmethod
     def info_dialog(title, message, **kwargs) -> str:
@@ -996,7 +1223,6 @@ class SmartFrame(tk.Frame):
     def yesno_dialog(title, message, **kwargs) -> bool:
         return messagebox.askyesno(title, message, **kwargs)
 
-    @contextlib.contextmanager
     def set_master(
         self,
         master: MASTER_TYPING | tp.Callable | str = None,
@@ -1004,65 +1230,36 @@ class SmartFrame(tk.Frame):
         auto_columns: int = None,
         grid_defaults: dict[str, tp.Any] = None,
         **frame_kwargs,
-    ):
+    ) -> _MasterContext:
         """Context manager to temporarily set the master of the SmartFrame.
 
         Resets to previous master after use.
         """
-        previous_frame = self.current_frame
-
-        if master is None:
-            self.current_frame = self.Frame(**frame_kwargs)
-        else:
-            if isinstance(master, str):
-                try:
-                    master = getattr(self, master)
-                except AttributeError:
-                    raise ValueError(
-                        f"Invalid master type string: {master}. Must be one of: Frame, Toplevel, Notebook, Canvas"
-                    )
-            if master in {self.Frame, self.Toplevel, self.Notebook, self.Canvas}:
-                self.current_frame = master(**frame_kwargs)
-            elif isinstance(master, (tk.Toplevel, ttk.Notebook, tk.Frame, tk.Canvas)):
-                if frame_kwargs:
-                    raise ValueError("Cannot use `set_master` keyword arguments when passing an existing `master`.")
-                self.current_frame = master
-            else:
-                raise TypeError("`master` can only be set to a Toplevel, Notebook, Frame, or Canvas.")
-
-        previous_auto_row = self.current_row
-        previous_auto_column = self.current_column
-        self.current_row = auto_rows
-        self.current_column = auto_columns
-
-        if grid_defaults is not None:
-            previous_grid_defaults = self.grid_defaults.copy()
-            self.grid_defaults = grid_defaults
-        else:
-            previous_grid_defaults = {}
-
-        try:
-            yield self.current_frame
-        finally:
-            self.current_row = previous_auto_row
-            self.current_column = previous_auto_column
-            if grid_defaults is not None:
-                self.grid_defaults = previous_grid_defaults
-            self.current_frame = previous_frame
+        return _MasterContext(self, master, auto_rows, auto_columns, grid_defaults, frame_kwargs)
 
     # endregion
 
     # region Private Methods
 
+    def _get_validate_command(self, validator: tp.Callable[[str], bool]) -> str:
+        """Get Tcl command name for `validator`, registered only once per Tk root (validators are stateless)."""
+        root = self._root()
+        root_commands = _VALIDATE_COMMANDS.setdefault(root, {})
+        try:
+            return root_commands[validator]
+        except KeyError:
+            command_name = root_commands[validator] = root.register(validator)
+            return command_name
+
     @staticmethod
     def _validate_entry_integers(new_value):
         """Callback invoked whenever the Entry contents change.
 
         Returns True if the value of the Entry ('%P') can be interpreted as an `int` (or is empty or a minus sign).
         """
-        if new_value in {"", "-"}:
-            return True  # Empty strings and minus sign only is permitted (minus sign must be handled by caller).
-        try:
+        if _INTEGER_ENTRY_RE.fullmatch(new_value):
+            return True  # includes empty string and minus sign only (minus sign must be handled by caller)
+        try:  # rarer forms accepted by `int()`, e.g. '+5' or '1_000'
             int(new_value)
         except ValueError:
             return False
@@ -1074,9 +1271,9 @@ class SmartFrame(tk.Frame):
 
         Returns True if the value of the Entry ('%P') can be interpreted as a `float` (or is empty or a minus sign).
         """
-        if new_value in {"", "-"}:
-            return True  # Empty strings and minus sign only is permitted (minus sign must be handled by caller).
-        try:
+        if _NUMBER_ENTRY_RE.fullmatch(new_value):
+            return True  # includes empty string and minus sign only (minus sign must be handled by caller)
+        try:  # rarer forms accepted by `float()`, e.g. '1e5' or 'inf'
             float(new_value)
         except ValueError:
             return False
@@ -1091,19 +1288,22 @@ class SmartFrame(tk.Frame):
             except KeyError:
                 raise KeyError(f"Invalid `SmartFrame.DEFAULT_BUTTON_KWARGS` key: {button_kwargs}")
         elif isinstance(button_kwargs, (tuple, list)):
-            button_kwargs = list(button_kwargs)
-            for i, b in enumerate(button_kwargs):
+            default_button_kwargs = self.DEFAULT_BUTTON_KWARGS
+            processed = []
+            for b in button_kwargs:
                 if isinstance(b, str):
                     try:
-                        button_kwargs[i] = self.DEFAULT_BUTTON_KWARGS[b]
+                        processed.append(default_button_kwargs[b])
                     except KeyError:
                         raise KeyError(f"Invalid `SmartFrame.DEFAULT_BUTTON_KWARGS` key: {b}")
-                elif not isinstance(b, dict):
+                elif isinstance(b, dict):
+                    processed.append(b)
+                else:
                     raise TypeError(
                         f"If `button_kwargs` is a sequence, each element should be a string key to "
                         f"`SmartFrame.DEFAULT_BUTTON_KWARGS` or a dictionary of `Button` kwargs, not: {type(b)}"
                     )
-            return button_kwargs
+            return processed
         elif not isinstance(button_kwargs, dict):
             raise TypeError(
                 f"`button_kwargs` should be a dictionary of `Button` kwargs, a sequence of such dicts (one per button "
@@ -1116,7 +1316,11 @@ class SmartFrame(tk.Frame):
 
 
 class SmartMenu(tk.Menu):
-    """Menu subclass that automatically applies style defaults to kwargs passed to `tk.Menu` methods."""
+    """Menu subclass that records its style defaults.
+
+    Entries are added with the caller's kwargs only. Tk entries with no colour of their own already use the menu's
+    `fg`/`bg`, so the style is not merged into each `add_*()` call.
+    """
 
     style: dict[str, str]
 
@@ -1127,32 +1331,6 @@ class SmartMenu(tk.Menu):
                 self.style[style_key] = kwargs[style_key]
         super().__init__(*args, **kwargs)
 
-    def add_cascade(self, *args, **kwargs):
-        self._apply_style_kwargs(**kwargs)
-        super().add_cascade(*args, **kwargs)
-
-    def add_checkbutton(self, *args, **kwargs):
-        self._apply_style_kwargs(**kwargs)
-        super().add_checkbutton(*args, **kwargs)
-
-    def add_command(self, *args, **kwargs):
-        self._apply_style_kwargs(**kwargs)
-        super().add_command(*args, **kwargs)
-
-    def add_radiobutton(self, *args, **kwargs):
-        self._apply_style_kwargs(**kwargs)
-        super().add_radiobutton(*args, **kwargs)
-
-    def add_separator(self, *args, **kwargs):
-        self._apply_style_kwargs(("bg",), **kwargs)
-        super().add_separator(*args, **kwargs)
-
-    def _apply_style_kwargs(self, only_keys=(), **kwargs):
-        for key, value in self.style.items():
-            if only_keys and key not in only_keys:
-                continue
-            kwargs.setdefault(key, value)
-
 
 class LoadingDialog(SmartFrame):
     """Simple box with a message and a loading bar. It is destroyed when appropriate."""
@@ -1175,7 +1353,7 @@ class LoadingDialog(SmartFrame):
         progressbar_kwargs.setdefault("sticky", EW)
 
         with self.set_master(auto_rows=0, padx=20, pady=20):
-            self.Label(text=message, font=font, pady=10)
+            self.Label(text=message, font=font, pady=10, mutable=False)
             self.progress = self.Progressbar(**progressbar_kwargs)
 
         self.set_geometry(transient=True)
@@ -1213,10 +1391,12 @@ class CustomDialog(SmartFrame):
 
         self.protocol("WM_DELETE_WINDOW", self.wm_delete_window)
         self.resizable(width=False, height=False)
-        if escape_enabled:
-            bind_to_all_children(self.toplevel, "<Escape>", lambda _: self.wm_delete_window())
         self.return_output = return_output
-        bind_to_all_children(self.toplevel, "<Return>", self.return_event)
+        # Every descendant widget has the toplevel in its bindtags, so these catch key presses from any focused child
+        # without walking (and binding to) each one.
+        self.toplevel.bind("<Return>", self.return_event)
+        if escape_enabled:
+            self.toplevel.bind("<Escape>", lambda _: self.wm_delete_window())
 
         self.set_geometry(relative_position=(0.5, 0.3), transient=True)
 
@@ -1227,19 +1407,22 @@ class CustomDialog(SmartFrame):
         button index `i`).
         """
         with self.set_master(auto_rows=0, padx=20, pady=20):
-            self.Label(text=message, font=font, pady=20)
+            self.Label(text=message, font=font, pady=20, mutable=False)
             self.build_buttons(button_names, button_kwargs)
 
     def build_buttons(self, button_names, button_kwargs):
+        if not button_kwargs:
+            button_kwargs = ({},) * len(button_names)
+        default_output = self.default_output
         with self.set_master(auto_columns=0, pady=20):
-            for i in range(len(button_names)):
+            for i, (button_name, kwargs) in enumerate(zip(button_names, button_kwargs)):
                 button = self.Button(
-                    text=button_names[i],
+                    text=button_name,
                     command=lambda output=i: self.done(output),
                     padx=5,
-                    **(button_kwargs[i] if button_kwargs else {}),
+                    **kwargs,
                 )
-                if i == self.default_output:
+                if i == default_output:
                     button["relief"] = RIDGE
 
     def go(self):
@@ -1276,6 +1459,22 @@ class CustomDialog(SmartFrame):
 class ToolTip:
     """Class that creates a tooltip for a given widget."""
 
+    # One `ToolTip` may exist per editor row/field, so instances skip `__dict__`.
+    __slots__ = (
+        "delay",
+        "wraplength",
+        "x_offset",
+        "y_offset",
+        "widgets",
+        "entered_widget_ids",
+        "anchor_widget",
+        "text",
+        "schedule_id",
+        "tip_box",
+        "tag",
+        "funcids",
+    )
+
     def __init__(
         self,
         main_widget,
@@ -1294,29 +1493,47 @@ class ToolTip:
         self.x_offset = x_offset
         self.y_offset = y_offset
         self.widgets = [main_widget] + list(child_widgets)
-        self.widget_status = {id(w): False for w in self.widgets}
+        self.entered_widget_ids = set()  # tooltip is scheduled/shown while any widget is entered
         self.anchor_widget = main_widget if anchor_widget is None else anchor_widget
         self.text = text
+        # All widgets share one bind tag, so each event is bound once rather than once per widget.
+        # Class bindings are never cleaned up by Tk, so their Tcl commands are recorded for `destroy()` to delete,
+        # which also happens automatically when the main widget is destroyed.
+        self.tag = f"ToolTip{id(self)}"
         for widget in self.widgets:
-            widget.bind("<Enter>", lambda _: self.enter(widget))
-            widget.bind("<Leave>", lambda _: self.leave(widget))
-            widget.bind("<ButtonPress>", lambda _: self.leave(widget))
+            widget.bindtags(widget.bindtags() + (self.tag,))
+        self.funcids = {
+            "<Enter>": main_widget.bind_class(self.tag, "<Enter>", self._on_enter),
+            "<Leave>": main_widget.bind_class(self.tag, "<Leave>", self._on_leave),
+            "<ButtonPress>": main_widget.bind_class(self.tag, "<ButtonPress>", self._on_leave),
+            "<Destroy>": main_widget.bind_class(self.tag, "<Destroy>", self._on_destroy),
+        }
         self.schedule_id = None
         self.tip_box = None
 
+    def _on_enter(self, event):
+        self.enter(event.widget)
+
+    def _on_leave(self, event):
+        self.leave(event.widget)
+
+    def _on_destroy(self, event):
+        if event.widget is self.widgets[0]:  # child widgets share the tag
+            self.destroy()
+
     def enter(self, widget):
         if self.text is None:
             return
-        schedule_tip = not any(self.widget_status.values())
-        self.widget_status[id(widget)] = True
+        schedule_tip = not self.entered_widget_ids
+        self.entered_widget_ids.add(id(widget))
         if schedule_tip:
             self.schedule()
 
     def leave(self, widget):
         if self.text is None:
             return
-        self.widget_status[id(widget)] = False
-        if not any(self.widget_status.values()):
+        self.entered_widget_ids.discard(id(widget))
+        if not self.entered_widget_ids:
             self.unschedule()
             self.hide_tip()
 
@@ -1333,31 +1550,64 @@ class ToolTip:
         x, y, cx, cy = self.anchor_widget.bbox("insert")
         x += self.anchor_widget.winfo_rootx() + self.x_offset
         y += self.anchor_widget.winfo_rooty() + self.y_offset
-        self.tip_box = tk.Toplevel(self.anchor_widget)
-        self.tip_box.wm_overrideredirect(True)  # remove border
-        self.tip_box.wm_geometry(f"+{x}+{y}")
+        tip_box, tip_message = self._get_tip_box()
+        tip_message.configure(text=self.text, wraplength=self.wraplength)
+        tip_box.wm_geometry(f"+{x}+{y}")
+        tip_box.owner = self
+        tip_box.deiconify()
+        tip_box.lift()  # outside Windows, `deiconify()` alone leaves it below any windows opened since it was created
+        self.tip_box = tip_box
+
+    def _get_tip_box(self) -> tuple[tk.Toplevel, tk.Label]:
+        """Get the tooltip box shared by all tooltips under this Tk root, creating it (withdrawn) on first use.
+
+        It is parented to the root rather than the anchor widget so that it survives any one window being destroyed, and
+        stored on the root (which it references anyway) so that it goes away with it.
+        """
+        # noinspection PyProtectedMember
+        root = self.anchor_widget._root()
+        try:
+            return root.tooltip_box
+        except AttributeError:
+            pass
+        tip_box = tk.Toplevel(root)
+        tip_box.withdraw()
+        tip_box.wm_overrideredirect(True)  # remove border
+        tip_box.owner = None
         tip_message = tk.Label(
-            self.tip_box,
-            text=self.text,
+            tip_box,
             justify="left",
             bg="#FFFFFF",
             relief="solid",
             borderwidth=1,
-            wraplength=self.wraplength,
         )
         tip_message.pack(ipadx=1)
+        root.tooltip_box = tip_box, tip_message
+        return tip_box, tip_message
 
     def hide_tip(self):
         tip_box, self.tip_box = self.tip_box, None
-        if tip_box:
-            tip_box.destroy()
+        if tip_box and tip_box.owner is self:  # shared box may have since been shown by another tooltip
+            tip_box.owner = None
+            tip_box.withdraw()
 
     def destroy(self):
-        if self.tip_box:
-            self.tip_box.destroy()
+        self.unschedule()
+        self.hide_tip()
+        main_widget = self.widgets[0]
+        funcids, self.funcids = self.funcids, {}
+        for sequence, funcid in funcids.items():
+            try:
+                main_widget.unbind_class(self.tag, sequence)
+            except tk.TclError:  # Tk root already destroyed
+                pass
+            main_widget.deletecommand(funcid)
 
 
 def print_widget_hierarchy(widget, indent=0):
-    print(" " * indent + str(widget))
-    for child in widget.winfo_children():
-        print_widget_hierarchy(child, indent=indent + 4)
+    stack = [(widget, indent)]
+    while stack:
+        widget, indent = stack.pop()
+        print(" " * indent + str(widget))
+        # Reversed so that children are printed in their original order.
+        stack.extend((child, indent + 4) for child in reversed(widget.winfo_children()))